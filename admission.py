@@ -0,0 +1,141 @@
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted; carries the HTTP status and Retry-After hint"""
+
+    def __init__(self, status_code: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionController:
+    """Bounds concurrent parses and queues the overflow in priority lanes.
+
+    Requests beyond ``max_concurrency`` wait in a bounded queue; interactive
+    waiters are always woken before bulk ones. When the queue is full the
+    request is rejected immediately instead of piling up on the CPU.
+    """
+
+    LANES = ("interactive", "bulk")
+
+    def __init__(self, max_concurrency: Optional[int] = None, max_queue: Optional[int] = None,
+                 max_bulk_queue: Optional[int] = None, queue_timeout: Optional[float] = None,
+                 retry_after: Optional[int] = None):
+        self.max_concurrency = max_concurrency or int(os.getenv("ADMISSION_MAX_CONCURRENCY", os.cpu_count() or 2))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv("ADMISSION_MAX_QUEUE", 32))
+        self.max_bulk_queue = (max_bulk_queue if max_bulk_queue is not None
+                               else int(os.getenv("ADMISSION_MAX_BULK_QUEUE", self.max_queue // 2)))
+        self.queue_timeout = (queue_timeout if queue_timeout is not None
+                              else float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 30)))
+        self.retry_after = retry_after if retry_after is not None else int(os.getenv("ADMISSION_RETRY_AFTER", 5))
+
+        self._active = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {lane: deque() for lane in self.LANES}
+
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_last = 0.0
+
+    def lane_for(self, priority: Optional[str]) -> str:
+        """Map a client-supplied priority to a lane; anything unknown is interactive"""
+        if priority and priority.strip().lower() == "bulk":
+            return "bulk"
+        return "interactive"
+
+    @asynccontextmanager
+    async def slot(self, lane: str = "interactive"):
+        await self._acquire(lane)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, lane: str):
+        start = time.monotonic()
+
+        if self._active < self.max_concurrency and self.queue_depth() == 0:
+            self._active += 1
+            self._record_admit(0.0)
+            return
+
+        # Bulk clients are always told to slow down (429), even when the whole queue is full
+        if lane == "bulk" and (len(self._waiters["bulk"]) >= self.max_bulk_queue
+                               or self.queue_depth() >= self.max_queue):
+            self._rejected += 1
+            raise AdmissionRejected(429, self.retry_after, "Too many bulk uploads queued")
+        if self.queue_depth() >= self.max_queue:
+            self._rejected += 1
+            raise AdmissionRejected(503, self.retry_after, "Server busy, upload queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            # The slot may have been handed over in the same loop iteration the timeout fired
+            if not (waiter.done() and not waiter.cancelled()):
+                self._discard(lane, waiter)
+                self._timed_out += 1
+                self._rejected += 1
+                raise AdmissionRejected(503, self.retry_after, "Timed out waiting for a parse slot")
+        except asyncio.CancelledError:
+            # Client went away; if the slot was already handed over, pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            else:
+                self._discard(lane, waiter)
+            raise
+
+        self._record_admit(time.monotonic() - start)
+
+    def _release(self):
+        # Hand the slot straight to the next waiter so it can't be stolen by a new arrival
+        for lane in self.LANES:
+            queue = self._waiters[lane]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self._active -= 1
+
+    def _discard(self, lane: str, waiter: asyncio.Future):
+        try:
+            self._waiters[lane].remove(waiter)
+        except ValueError:
+            pass
+
+    def _record_admit(self, waited: float):
+        self._admitted += 1
+        self._wait_total += waited
+        self._wait_last = waited
+        self._wait_max = max(self._wait_max, waited)
+
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    def stats(self) -> Dict:
+        return {
+            "active": self._active,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth(),
+            "queue_depth_by_lane": {lane: len(queue) for lane, queue in self._waiters.items()},
+            "max_queue": self.max_queue,
+            "admitted_total": self._admitted,
+            "rejected_total": self._rejected,
+            "timed_out_total": self._timed_out,
+            "wait_seconds_last": round(self._wait_last, 4),
+            "wait_seconds_avg": round(self._wait_total / self._admitted, 4) if self._admitted else 0.0,
+            "wait_seconds_max": round(self._wait_max, 4),
+        }
@@ -1,14 +1,17 @@
-from fastapi import FastAPI, UploadFile, File, Request
+from fastapi import FastAPI, UploadFile, File, Request, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-from typing import List, Dict
+from typing import List, Dict, Optional
 import json
 
-from resume_parser import ResumeParser
+from resume_parser import ResumeParser, ParsedResume, UnknownFieldError
 from question_generator import QuestionGenerator
 from response_analyzer import ResponseAnalyzer
+from admission import AdmissionController, AdmissionRejected
+from profiling import ParseProfiler
 
 app = FastAPI(title="AI Interview System")
 templates = Jinja2Templates(directory="templates")
@@ -25,6 +28,8 @@ app.add_middleware(
 parser = ResumeParser()
 question_gen = QuestionGenerator()
 analyzer = ResponseAnalyzer()
+admission = AdmissionController()
+profiler = ParseProfiler()
 
 class InterviewResponse(BaseModel):
     question_id: str
@@ -38,17 +43,67 @@ class InterviewSession(BaseModel):
 async def home(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected(request: Request, exc: AdmissionRejected):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.reason},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 @app.post("/upload-resume")
-async def upload_resume(file: UploadFile = File(...)):
-    content = await file.read()
-    parsed_data = parser.parse(content, file.filename)
+async def upload_resume(file: UploadFile = File(...), fields: Optional[str] = None,
+                        x_upload_priority: Optional[str] = Header(None),
+                        x_profile_token: Optional[str] = Header(None)):
+    # Optional comma-separated selector, e.g. ?fields=name,email, so only the needed stages run
+    selected = [field.strip() for field in fields.split(',') if field.strip()] if fields else None
+    try:
+        ParsedResume.validate_fields(selected)
+    except UnknownFieldError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    profile_id = profiler.new_profile_id() if profiler.should_profile(x_profile_token) else None
+
+    # Parsing is CPU bound, so cap how many run at once and queue the rest
+    async with admission.slot(admission.lane_for(x_upload_priority)):
+        content = await file.read()
+        if profile_id:
+            parsed_data, stored = await run_in_threadpool(
+                profiler.run, profile_id, parser.parse, content, file.filename, selected
+            )
+            if not stored:
+                profile_id = None
+        else:
+            parsed_data = await run_in_threadpool(parser.parse, content, file.filename, selected)
     questions = question_gen.generate_questions(parsed_data)
     
-    return {
+    result = {
         "session_id": f"session_{hash(file.filename)}",
         "parsed_resume": parsed_data,
         "questions": questions
     }
+    if profile_id:
+        result["profile_id"] = profile_id
+    return result
+
+@app.get("/admission-stats")
+async def admission_stats():
+    return admission.stats()
+
+@app.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, format: str = "text", x_profile_token: Optional[str] = Header(None)):
+    if not profiler.is_admin(x_profile_token):
+        raise HTTPException(status_code=403, detail="Profile access requires the admin token")
+    profile = profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "pstats":
+        return Response(
+            content=profile["raw"],
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f"attachment; filename={profile_id}.pstats"}
+        )
+    return PlainTextResponse(profile["text"])
 
 @app.post("/submit-interview")
 async def submit_interview(session: InterviewSession):
@@ -0,0 +1,90 @@
+import cProfile
+import hmac
+import io
+import marshal
+import os
+import pstats
+import random
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ParseProfiler:
+    """Opt-in cProfile hook for resume parsing.
+
+    A parse is profiled when the caller presents the admin token or when it is
+    picked by the sampling rate. Sampling needs the admin token too, since only
+    admins can read the results. Unless the token is configured,
+    ``should_profile`` is a single attribute check. Results are kept in memory,
+    newest first, and looked up by profile ID.
+    """
+
+    def __init__(self, admin_token: Optional[str] = None, sample_rate: Optional[float] = None,
+                 max_stored: Optional[int] = None, top_n: Optional[int] = None):
+        self.admin_token = admin_token or os.getenv("PROFILE_ADMIN_TOKEN", "")
+        self.sample_rate = sample_rate if sample_rate is not None else float(os.getenv("PROFILE_SAMPLE_RATE", 0))
+        self.max_stored = max_stored or int(os.getenv("PROFILE_MAX_STORED", 50))
+        self.top_n = top_n or int(os.getenv("PROFILE_TOP_N", 40))
+        if self.sample_rate > 0 and not self.admin_token:
+            print("PROFILE_SAMPLE_RATE ignored: PROFILE_ADMIN_TOKEN is not set, so profiles could not be read")
+            self.sample_rate = 0.0
+        self.enabled = bool(self.admin_token)
+
+        self._profiles: "OrderedDict[str, Dict]" = OrderedDict()
+        self._store_lock = threading.Lock()
+        # cProfile can only be active in one thread at a time, so concurrent requests run unprofiled
+        self._profile_lock = threading.Lock()
+
+    def is_admin(self, token: Optional[str]) -> bool:
+        if not (self.admin_token and token):
+            return False
+        # compare_digest rejects non-ASCII str, and headers arrive latin-1 decoded, so compare bytes
+        return hmac.compare_digest(token.encode("utf-8", "surrogateescape"),
+                                   self.admin_token.encode("utf-8", "surrogateescape"))
+
+    def should_profile(self, token: Optional[str]) -> bool:
+        if not self.enabled:
+            return False
+        if self.is_admin(token):
+            return True
+        return random.random() < self.sample_rate
+
+    def new_profile_id(self) -> str:
+        return uuid.uuid4().hex
+
+    def run(self, profile_id: str, func: Callable, *args) -> Tuple[Any, bool]:
+        """Call ``func`` under cProfile and store the stats under ``profile_id``.
+
+        Returns ``(result, stored)``; ``stored`` is False when another profile was
+        already running and ``func`` ran unprofiled. Nothing is stored if ``func``
+        raises, since the caller never gets to hand out the ID.
+        """
+        if not self._profile_lock.acquire(blocking=False):
+            return func(*args), False
+
+        profile = cProfile.Profile()
+        try:
+            result = profile.runcall(func, *args)
+        finally:
+            self._profile_lock.release()
+        self._store(profile_id, profile)
+        return result, True
+
+    def _store(self, profile_id: str, profile: cProfile.Profile):
+        output = io.StringIO()
+        stats = pstats.Stats(profile, stream=output)
+        stats.sort_stats("cumulative").print_stats(self.top_n)
+
+        with self._store_lock:
+            self._profiles[profile_id] = {
+                "text": output.getvalue(),
+                "raw": marshal.dumps(stats.stats),
+            }
+            while len(self._profiles) > self.max_stored:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Dict]:
+        with self._store_lock:
+            return self._profiles.get(profile_id)
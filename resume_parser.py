@@ -3,7 +3,9 @@ import docx
 import re
 import spacy
 from pyresparser import ResumeParser as PyResumeParser
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional
+from collections.abc import Mapping
+from functools import cached_property
 import tempfile
 import os
 import fitz  # PyMuPDF
@@ -18,73 +20,79 @@ class ResumeParser:
         except OSError:
             self.nlp = None
     
-    def parse(self, content: bytes, filename: str) -> Dict:
-        text = self._extract_text(content, filename)
-        
-        # Use pyresparser for structured extraction
-        parsed_data = self._parse_with_pyresparser(content, filename)
-        
-        # Enhance with spaCy NLP
-        enhanced_data = self._enhance_with_spacy(text, parsed_data)
-        
+    def parse(self, content: bytes, filename: str, fields: Optional[Iterable[str]] = None) -> Dict:
+        """Parse a resume, computing only the requested ``fields`` (all of them by default)"""
+        resume = self.parse_lazy(content, filename, fields)
+        enhanced_data = dict(resume)
+        print(f"Final enhanced data: {enhanced_data}")
         return enhanced_data
     
-    def _extract_text(self, content: bytes, filename: str) -> str:
+    def parse_lazy(self, content: bytes, filename: str, fields: Optional[Iterable[str]] = None) -> "ParsedResume":
+        """Return a mapping whose fields are extracted on first access"""
+        return ParsedResume(self, content, filename, fields)
+    
+    def _extract_text(self, content: bytes, filename: str, max_pages: Optional[int] = None) -> str:
+        return ''.join(self._extract_pages(content, filename, max_pages))
+    
+    def _extract_pages(self, content: bytes, filename: str, max_pages: Optional[int] = None) -> List[str]:
+        # Only PDFs have pages; other formats come back as a single page
         if filename.endswith('.pdf'):
-            return self._extract_from_pdf(content)
+            return self._extract_pdf_pages(content, max_pages)
         elif filename.endswith('.docx'):
-            return self._extract_from_docx(content)
-        return content.decode('utf-8')
+            return [self._extract_from_docx(content)]
+        return [content.decode('utf-8')]
     
-    def _extract_from_pdf(self, content: bytes) -> str:
+    def _extract_pdf_pages(self, content: bytes, max_pages: Optional[int] = None) -> List[str]:
         from io import BytesIO
         
         # Method 1: PyPDF2
         try:
             reader = PyPDF2.PdfReader(BytesIO(content))
-            text = ''.join(page.extract_text() for page in reader.pages)
-            if text.strip():
+            pages = [page.extract_text() for page in reader.pages[:max_pages]]
+            if ''.join(pages).strip():
                 print("PDF extracted with PyPDF2")
-                return text
+                return pages
         except Exception as e:
             print(f"PyPDF2 failed: {e}")
         
         # Method 2: PyMuPDF (fitz)
         try:
             doc = fitz.open(stream=content, filetype="pdf")
-            text = ""
-            for page in doc:
-                text += page.get_text()
+            pages = []
+            for page_num, page in enumerate(doc):
+                if max_pages is not None and page_num >= max_pages:
+                    break
+                pages.append(page.get_text())
             doc.close()
-            if text.strip():
+            if ''.join(pages).strip():
                 print("PDF extracted with PyMuPDF")
-                return text
+                return pages
         except Exception as e:
             print(f"PyMuPDF failed: {e}")
         
         # Method 3: pdfminer
         try:
-            text = pdfminer_extract(BytesIO(content))
+            text = pdfminer_extract(BytesIO(content), maxpages=max_pages or 0)
+            # pdfminer ends each page with a form feed; split after it so joining restores the text
+            pages = [page for page in re.split(r'(?<=\f)', text) if page]
             if text.strip():
                 print("PDF extracted with pdfminer")
-                return text
+                return pages
         except Exception as e:
             print(f"pdfminer failed: {e}")
         
         # Method 4: pdfplumber
         try:
             with pdfplumber.open(BytesIO(content)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-            if text.strip():
+                pages = [page.extract_text() or "" for page in pdf.pages[:max_pages]]
+            if ''.join(pages).strip():
                 print("PDF extracted with pdfplumber")
-                return text
+                return pages
         except Exception as e:
             print(f"pdfplumber failed: {e}")
         
         print("All PDF extraction methods failed")
-        return ""
+        return []
     
     def _extract_from_docx(self, content: bytes) -> str:
         from io import BytesIO
@@ -105,20 +113,6 @@ class ResumeParser:
             print(f"Pyresparser error: {e}")
             return {}
     
-    def _enhance_with_spacy(self, text: str, base_data: Dict) -> Dict:
-        print(f"Raw text preview: {text[:200]}...")
-        enhanced = {
-            "name": base_data.get('name') or self._extract_name_spacy(text),
-            "email": base_data.get('email') or self._extract_email(text),
-            "phone": base_data.get('mobile_number', '') or self._extract_phone(text),
-            "skills": base_data.get('skills', []) or self._extract_skills_spacy(text),
-            "experience": base_data.get('total_experience') or self._extract_experience(text),
-            "education": base_data.get('degree', []) or self._extract_education(text),
-            "projects": self._extract_projects_spacy(text)
-        }
-        print(f"Final enhanced data: {enhanced}")
-        return enhanced
-    
     def _extract_name_spacy(self, text: str) -> str:
         # Try multiple extraction methods
         
@@ -432,4 +426,97 @@ class ResumeParser:
                 if len(line.strip()) > 10:
                     education.append(line.strip())
         
-        return education[:3]
\ No newline at end of file
+        return education[:3]
+
+
+class UnknownFieldError(ValueError):
+    """Raised when a field selector names a field ParsedResume does not provide"""
+
+
+class ParsedResume(Mapping):
+    """Resume fields extracted lazily, running only the stages each field needs.
+
+    Contact fields (name, email, phone) always come from the first page of a
+    PDF and never from pyresparser, so they are the same whichever other
+    fields are selected. Pages are extracted once: just the first page when
+    only contact fields are selected, otherwise all of them. pyresparser only
+    runs for skills, experience and education.
+    """
+
+    FIELDS = ("name", "email", "phone", "skills", "experience", "education", "projects")
+    CONTACT_FIELDS = ("name", "email", "phone")
+
+    def __init__(self, parser: ResumeParser, content: bytes, filename: str, fields: Optional[Iterable[str]] = None):
+        requested = self.validate_fields(fields)
+
+        self._parser = parser
+        self._content = content
+        self._filename = filename
+        self.fields = tuple(field for field in self.FIELDS if field in requested)
+        self._contact_only = all(field in self.CONTACT_FIELDS for field in self.fields)
+        self._values: Dict = {}
+
+    @classmethod
+    def validate_fields(cls, fields: Optional[Iterable[str]]) -> set:
+        """Return the selected field names; ``None`` selects all and a str selects one"""
+        if fields is None:
+            return set(cls.FIELDS)
+        requested = {fields} if isinstance(fields, str) else set(fields)
+        unknown = requested - set(cls.FIELDS)
+        if unknown:
+            raise UnknownFieldError(f"Unknown resume fields: {', '.join(sorted(unknown))}")
+        return requested
+
+    def __getitem__(self, field: str):
+        if field not in self.fields:
+            raise KeyError(field)
+        if field not in self._values:
+            self._values[field] = getattr(self, f"_get_{field}")()
+        return self._values[field]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    @cached_property
+    def pages(self) -> List[str]:
+        max_pages = 1 if self._contact_only else None
+        return self._parser._extract_pages(self._content, self._filename, max_pages=max_pages)
+
+    @cached_property
+    def text(self) -> str:
+        text = ''.join(self.pages)
+        print(f"Raw text preview: {text[:200]}...")
+        return text
+
+    @cached_property
+    def contact_text(self) -> str:
+        return self.pages[0] if self.pages else ""
+
+    @cached_property
+    def base_data(self) -> Dict:
+        # Use pyresparser for structured extraction
+        return self._parser._parse_with_pyresparser(self._content, self._filename)
+
+    def _get_name(self) -> str:
+        return self._parser._extract_name_spacy(self.contact_text)
+
+    def _get_email(self) -> str:
+        return self._parser._extract_email(self.contact_text)
+
+    def _get_phone(self) -> str:
+        return self._parser._extract_phone(self.contact_text)
+
+    def _get_skills(self) -> List[str]:
+        return self.base_data.get('skills', []) or self._parser._extract_skills_spacy(self.text)
+
+    def _get_experience(self) -> str:
+        return self.base_data.get('total_experience') or self._parser._extract_experience(self.text)
+
+    def _get_education(self) -> List[str]:
+        return self.base_data.get('degree', []) or self._parser._extract_education(self.text)
+
+    def _get_projects(self) -> List[str]:
+        return self._parser._extract_projects_spacy(self.text)
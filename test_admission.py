@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import asyncio
+from admission import AdmissionController, AdmissionRejected
+
+
+async def _job(controller, name, lane, order, hold=0.05):
+    try:
+        async with controller.slot(lane):
+            order.append(name)
+            await asyncio.sleep(hold)
+    except AdmissionRejected as e:
+        order.append((name, e.status_code, e.retry_after))
+
+
+async def _start(coro):
+    # Let each task reach the queue before the next one is created so arrival order is fixed
+    task = asyncio.create_task(coro)
+    await asyncio.sleep(0)
+    return task
+
+
+def test_lane_ordering():
+    async def run():
+        controller = AdmissionController(max_concurrency=1, max_queue=8, max_bulk_queue=4,
+                                         queue_timeout=5, retry_after=1)
+        order = []
+        tasks = [
+            await _start(_job(controller, "first", "interactive", order)),
+            await _start(_job(controller, "b1", "bulk", order)),
+            await _start(_job(controller, "i1", "interactive", order)),
+            await _start(_job(controller, "i2", "interactive", order)),
+        ]
+        await asyncio.gather(*tasks)
+        return order, controller.stats()
+
+    order, stats = asyncio.run(run())
+    assert order == ["first", "i1", "i2", "b1"]
+    assert stats["active"] == 0 and stats["admitted_total"] == 4
+
+
+def test_bulk_overflow_gets_429_and_full_queue_gets_503():
+    async def run():
+        controller = AdmissionController(max_concurrency=1, max_queue=2, max_bulk_queue=1,
+                                         queue_timeout=5, retry_after=7)
+        order = []
+        tasks = [
+            await _start(_job(controller, "first", "interactive", order)),
+            await _start(_job(controller, "b1", "bulk", order)),
+            await _start(_job(controller, "b2", "bulk", order)),
+            await _start(_job(controller, "i1", "interactive", order)),
+            await _start(_job(controller, "i2", "interactive", order)),
+        ]
+        await asyncio.gather(*tasks)
+        return order, controller.stats()
+
+    order, stats = asyncio.run(run())
+    assert ("b2", 429, 7) in order
+    assert ("i2", 503, 7) in order
+    assert stats["rejected_total"] == 2 and stats["active"] == 0
+
+
+def test_bulk_gets_429_when_whole_queue_is_full():
+    async def run():
+        controller = AdmissionController(max_concurrency=1, max_queue=1, max_bulk_queue=4,
+                                         queue_timeout=5, retry_after=3)
+        order = []
+        tasks = [
+            await _start(_job(controller, "first", "interactive", order)),
+            await _start(_job(controller, "i1", "interactive", order)),
+            await _start(_job(controller, "b1", "bulk", order)),
+        ]
+        await asyncio.gather(*tasks)
+        return order
+
+    assert ("b1", 429, 3) in asyncio.run(run())
+
+
+def test_queue_timeout_gets_503():
+    async def run():
+        controller = AdmissionController(max_concurrency=1, max_queue=4, queue_timeout=0.01, retry_after=0)
+        order = []
+        tasks = [
+            await _start(_job(controller, "first", "interactive", order, hold=0.1)),
+            await _start(_job(controller, "late", "interactive", order)),
+        ]
+        await asyncio.gather(*tasks)
+        return order, controller.stats()
+
+    order, stats = asyncio.run(run())
+    assert order == ["first", ("late", 503, 0)]
+    assert stats["timed_out_total"] == 1
+    assert stats["active"] == 0 and stats["queue_depth"] == 0
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    async def run():
+        controller = AdmissionController(max_concurrency=1, max_queue=4, queue_timeout=5)
+        order = []
+        first = await _start(_job(controller, "first", "interactive", order))
+        waiting = await _start(_job(controller, "gone", "interactive", order))
+        waiting.cancel()
+        await first
+        await asyncio.gather(waiting, return_exceptions=True)
+        after = await _start(_job(controller, "after", "interactive", order))
+        await after
+        return order, controller.stats()
+
+    order, stats = asyncio.run(run())
+    assert order == ["first", "after"]
+    assert stats["active"] == 0 and stats["queue_depth"] == 0
+
+
+if __name__ == "__main__":
+    test_lane_ordering()
+    test_bulk_overflow_gets_429_and_full_queue_gets_503()
+    test_bulk_gets_429_when_whole_queue_is_full()
+    test_queue_timeout_gets_503()
+    test_cancelled_waiter_does_not_leak_slot()
+    print("Admission tests passed")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+from profiling import ParseProfiler
+
+
+def test_disabled_without_token():
+    profiler = ParseProfiler(admin_token="", sample_rate=0)
+    assert not profiler.enabled
+    assert not profiler.should_profile(None)
+    assert not profiler.should_profile("anything")
+
+
+def test_sampling_needs_admin_token():
+    profiler = ParseProfiler(admin_token="", sample_rate=1.0)
+    assert profiler.sample_rate == 0.0
+    assert not profiler.enabled
+    assert not profiler.should_profile(None)
+
+    profiler = ParseProfiler(admin_token="secret", sample_rate=1.0)
+    assert profiler.should_profile(None)
+
+
+def test_is_admin_with_non_ascii_token():
+    profiler = ParseProfiler(admin_token="secret")
+    assert profiler.is_admin("secret")
+    assert not profiler.is_admin("\xe9")
+    assert not profiler.is_admin(None)
+
+
+def test_run_stores_profile():
+    profiler = ParseProfiler(admin_token="secret")
+    result, stored = profiler.run("p1", sorted, [3, 1, 2])
+    assert result == [1, 2, 3] and stored
+    profile = profiler.get("p1")
+    assert "sorted" in profile["text"] and profile["raw"]
+
+
+def test_run_unprofiled_when_busy():
+    profiler = ParseProfiler(admin_token="secret")
+    profiler._profile_lock.acquire()
+    try:
+        assert profiler.run("busy", sorted, [2, 1]) == ([1, 2], False)
+    finally:
+        profiler._profile_lock.release()
+    assert profiler.get("busy") is None
+
+
+def test_failed_run_is_not_stored():
+    profiler = ParseProfiler(admin_token="secret")
+
+    def fail():
+        raise RuntimeError("parse failed")
+
+    try:
+        profiler.run("failed", fail)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("run should re-raise the parse error")
+    assert profiler.get("failed") is None
+    assert profiler.run("after", sorted, [1])[1]
+
+
+def test_store_evicts_oldest():
+    profiler = ParseProfiler(admin_token="secret", max_stored=2)
+    for profile_id in ("a", "b", "c"):
+        profiler.run(profile_id, sorted, [1])
+    assert profiler.get("a") is None
+    assert profiler.get("b") is not None and profiler.get("c") is not None
+
+
+def test_profiles_endpoint_access():
+    from fastapi.testclient import TestClient
+    import main
+
+    original = main.profiler
+    main.profiler = ParseProfiler(admin_token="secret")
+    try:
+        client = TestClient(main.app)
+        assert client.get("/profiles/missing").status_code == 403
+        assert client.get("/profiles/missing", headers={"X-Profile-Token": "wrong"}).status_code == 403
+        assert client.get("/profiles/missing", headers={"X-Profile-Token": "secret"}).status_code == 404
+
+        main.profiler.run("known", sorted, [1])
+        response = client.get("/profiles/known", headers={"X-Profile-Token": "secret"})
+        assert response.status_code == 200 and "sorted" in response.text
+    finally:
+        main.profiler = original
+
+
+if __name__ == "__main__":
+    test_disabled_without_token()
+    test_sampling_needs_admin_token()
+    test_is_admin_with_non_ascii_token()
+    test_run_stores_profile()
+    test_run_unprofiled_when_busy()
+    test_failed_run_is_not_stored()
+    test_store_evicts_oldest()
+    test_profiles_endpoint_access()
+    print("Profiling tests passed")
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
 from resume_parser import ResumeParser
+import os
 import sys
 
+SAMPLE_RESUME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_resume.txt")
+
 def test_resume_parser():
     parser = ResumeParser()
     
@@ -22,5 +25,54 @@ def test_resume_parser():
     else:
         print("Usage: python test_resume.py <resume_file_path>")
 
+def test_contact_fields_independent_of_selection():
+    parser = ResumeParser()
+    with open(SAMPLE_RESUME, 'rb') as f:
+        content = f.read()
+    
+    full = parser.parse(content, "sample_resume.txt")
+    for field in ("name", "email", "phone"):
+        assert parser.parse(content, "sample_resume.txt", [field])[field] == full[field]
+        assert parser.parse(content, "sample_resume.txt", [field, "skills"])[field] == full[field]
+    
+    assert list(parser.parse(content, "sample_resume.txt", "email")) == ["email"]
+    assert parser.parse(content, "sample_resume.txt", []) == {}
+
+def _stub_extraction(parser, pages):
+    calls = {"pages": [], "pyresparser": 0}
+    
+    def extract_pages(content, filename, max_pages=None):
+        calls["pages"].append(max_pages)
+        return pages[:max_pages]
+    
+    def parse_with_pyresparser(content, filename):
+        calls["pyresparser"] += 1
+        return {"email": "pyresparser@example.com", "skills": ["python"]}
+    
+    parser._extract_pages = extract_pages
+    parser._parse_with_pyresparser = parse_with_pyresparser
+    return calls
+
+def test_contact_fields_read_first_pdf_page_only():
+    pages = ["Jane Smith\njane.smith@example.com\n", "Projects\nother@example.com\n"]
+    
+    parser = ResumeParser()
+    calls = _stub_extraction(parser, pages)
+    email = parser.parse(b"", "resume.pdf", ["email"])["email"]
+    assert email == "jane.smith@example.com"
+    assert calls == {"pages": [1], "pyresparser": 0}
+    
+    parser = ResumeParser()
+    calls = _stub_extraction(parser, pages)
+    assert parser.parse(b"", "resume.pdf", ["skills"])["skills"] == ["python"]
+    assert calls["pyresparser"] == 1 and 1 not in calls["pages"]
+    
+    parser = ResumeParser()
+    calls = _stub_extraction(parser, pages)
+    assert parser.parse(b"", "resume.pdf")["email"] == email
+    assert calls == {"pages": [None], "pyresparser": 1}
+
 if __name__ == "__main__":
+    test_contact_fields_independent_of_selection()
+    test_contact_fields_read_first_pdf_page_only()
     test_resume_parser()
\ No newline at end of file